@@ -6,7 +6,10 @@ for automated PhotoPrism family onboarding.
 """
 
 from typing import List, Dict, Optional, Tuple
+from collections import OrderedDict
 from enum import Enum
+import asyncio
+import time
 import httpx
 import logging
 from pydantic import BaseModel
@@ -61,6 +64,12 @@ class DomainManager:
         self.api_credentials = api_credentials or {}
         self.client = httpx.AsyncClient(timeout=30.0)
 
+        # Short-lived cache of availability results, keyed by domain
+        # (insertion order == age, so the oldest entries are at the front)
+        self.availability_cache_ttl = 30.0  # seconds
+        self.availability_cache_size = 256
+        self._availability_cache: "OrderedDict[str, Tuple[float, DomainCheckResult]]" = OrderedDict()
+
     async def check_availability(
         self,
         family_name: str,
@@ -77,16 +86,24 @@ class DomainManager:
             DomainCheckResult with availability status
         """
         domain = f"{family_name.lower()}.{tld}"
+
+        cached = self._availability_cache.get(domain)
+        if cached:
+            if time.monotonic() - cached[0] < self.availability_cache_ttl:
+                logger.debug("Availability cache hit for: %s", domain)
+                return cached[1]
+            del self._availability_cache[domain]
+
         logger.info(f"Checking availability for: {domain}")
 
         try:
             # Route to appropriate registrar
             if self.preferred_registrar == DomainRegistrar.NAMECHEAP:
-                return await self._check_namecheap(domain)
+                result = await self._check_namecheap(domain)
             elif self.preferred_registrar == DomainRegistrar.CLOUDFLARE:
-                return await self._check_cloudflare(domain)
+                result = await self._check_cloudflare(domain)
             elif self.preferred_registrar == DomainRegistrar.GODADDY:
-                return await self._check_godaddy(domain)
+                result = await self._check_godaddy(domain)
             else:
                 return DomainCheckResult(
                     domain=domain,
@@ -95,6 +112,11 @@ class DomainManager:
                     error=f"Registrar {self.preferred_registrar} not implemented"
                 )
 
+            # Don't cache errors so transient failures are retried
+            if result.status != DomainStatus.ERROR:
+                self._cache_availability(domain, result)
+            return result
+
         except Exception as e:
             logger.error(f"Error checking domain {domain}: {e}")
             return DomainCheckResult(
@@ -104,6 +126,19 @@ class DomainManager:
                 error=str(e)
             )
 
+    def _cache_availability(self, domain: str, result: DomainCheckResult):
+        """Store a result, dropping expired entries and the oldest over the size cap"""
+        now = time.monotonic()
+        self._availability_cache[domain] = (now, result)
+        self._availability_cache.move_to_end(domain)
+
+        while self._availability_cache:
+            oldest_time, _ = next(iter(self._availability_cache.values()))
+            if (now - oldest_time < self.availability_cache_ttl and
+                    len(self._availability_cache) <= self.availability_cache_size):
+                break
+            self._availability_cache.popitem(last=False)
+
     async def suggest_alternatives(
         self,
         family_name: str,
@@ -137,10 +172,13 @@ class DomainManager:
             f"{base_name}2024",     # smith2024.family
         ]
 
-        # Check each variation
-        for i, variation in enumerate(variations[:max_suggestions]):
-            result = await self.check_availability(variation, tld)
+        # Check all variations concurrently (independent registrar lookups)
+        results = await asyncio.gather(*(
+            self.check_availability(variation, tld)
+            for variation in variations[:max_suggestions]
+        ))
 
+        for i, result in enumerate(results):
             if result.status == DomainStatus.AVAILABLE:
                 # Calculate relevance score (closer to original = higher score)
                 score = 1.0 - (i * 0.15)  # Decrease by 15% for each position
@@ -179,6 +217,9 @@ class DomainManager:
         """
         logger.info(f"Registering domain: {domain}")
 
+        # Availability changes once we attempt registration
+        self._availability_cache.pop(domain, None)
+
         try:
             if self.preferred_registrar == DomainRegistrar.NAMECHEAP:
                 return await self._register_namecheap(domain, contact_info, dns_records)
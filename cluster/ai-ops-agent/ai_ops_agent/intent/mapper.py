@@ -8,8 +8,25 @@ import yaml
 import logging
 from ..models import Intent, ExecutionPlan
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 logger = logging.getLogger(__name__)
 
+# Action verb → present participle used in plan descriptions
+ACTION_DESCRIPTIONS = {
+    "create": "Creating",
+    "update": "Updating",
+    "delete": "Deleting",
+    "rotate": "Rotating",
+    "issue": "Issuing",
+    "query": "Querying",
+    "scan": "Scanning",
+    "list": "Listing"
+}
+
 
 class ActionMapper:
     """Map intents to Terraform/Ansible execution plans"""
@@ -22,7 +39,7 @@ class ActionMapper:
         """Load intent → action mappings from YAML"""
         try:
             with open(self.mappings_path) as f:
-                mappings = yaml.safe_load(f)
+                mappings = yaml.load(f, Loader=SafeLoader)
                 logger.info(f"Loaded {len(mappings)} intent mappings")
                 return mappings
         except FileNotFoundError:
@@ -110,16 +127,7 @@ class ActionMapper:
     def _generate_description(self, intent: Intent) -> str:
         """Generate human-readable description"""
 
-        action_desc = {
-            "create": "Creating",
-            "update": "Updating",
-            "delete": "Deleting",
-            "rotate": "Rotating",
-            "issue": "Issuing",
-            "query": "Querying",
-            "scan": "Scanning",
-            "list": "Listing"
-        }.get(intent.action.value, "Processing")
+        action_desc = ACTION_DESCRIPTIONS.get(intent.action.value, "Processing")
 
         return f"{action_desc} {intent.resource_type}"
 
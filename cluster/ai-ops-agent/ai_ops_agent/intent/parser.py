@@ -14,10 +14,19 @@ logger = logging.getLogger(__name__)
 class IntentParser:
     """Parse natural language requests into structured intents"""
 
-    def __init__(self, ollama_host: str, model: str = "mistral"):
+    def __init__(
+        self,
+        ollama_host: str,
+        model: str = "mistral",
+        client: Optional[httpx.AsyncClient] = None
+    ):
         self.ollama_host = ollama_host.rstrip('/')
         self.model = model
-        self.client = httpx.AsyncClient(timeout=60.0)
+        self.generate_url = f"{self.ollama_host}/api/generate"
+
+        # Reuse a caller-provided client (shared connection pool) if given
+        self._owns_client = client is None
+        self.client = client or httpx.AsyncClient(timeout=60.0)
 
     async def parse(self, user_input: str) -> Intent:
         """
@@ -131,8 +140,6 @@ Response:"""
     async def _call_ollama(self, prompt: str) -> str:
         """Call Ollama API for generation"""
 
-        url = f"{self.ollama_host}/api/generate"
-
         payload = {
             "model": self.model,
             "prompt": prompt,
@@ -144,7 +151,7 @@ Response:"""
             }
         }
 
-        response = await self.client.post(url, json=payload)
+        response = await self.client.post(self.generate_url, json=payload)
         response.raise_for_status()
 
         data = response.json()
@@ -181,5 +188,6 @@ Response:"""
             }
 
     async def close(self):
-        """Close HTTP client"""
-        await self.client.aclose()
+        """Close HTTP client (only if owned by this parser)"""
+        if self._owns_client:
+            await self.client.aclose()
@@ -3,14 +3,23 @@ MCP Policy Engine: Evaluate execution plans against security/compliance policies
 """
 
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Tuple
 from datetime import datetime, time
 import logging
+import re
 import yaml
 from ..models import ExecutionPlan, UserContext, PolicyDecision, PolicyResult
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader
+
 logger = logging.getLogger(__name__)
 
+# Variable names that look like they hold credentials
+SECRET_NAME_PATTERN = re.compile(r"password|secret|key|token", re.IGNORECASE)
+
 
 class PolicyEngine:
     """Evaluate execution plans against MCP policies"""
@@ -18,12 +27,13 @@ class PolicyEngine:
     def __init__(self, policies_path: Path):
         self.policies_path = policies_path
         self.policies = self._load_policies()
+        self.change_windows = self._parse_change_windows()
 
     def _load_policies(self) -> Dict:
         """Load policies from YAML"""
         try:
             with open(self.policies_path) as f:
-                policies = yaml.safe_load(f)
+                policies = yaml.load(f, Loader=SafeLoader)
                 logger.info(f"Loaded MCP policies from {self.policies_path}")
                 return policies
         except FileNotFoundError:
@@ -33,6 +43,28 @@ class PolicyEngine:
             logger.error(f"Failed to parse policies YAML: {e}")
             return {}
 
+    def _parse_change_windows(self) -> Dict[str, List[Tuple[time, time]]]:
+        """Parse allowed change windows once, keyed by lowercase day name"""
+        windows: Dict[str, List[Tuple[time, time]]] = {}
+        allowed_windows = (
+            self.policies.get("operational", {})
+            .get("change_windows", {})
+            .get("allowed_windows", [])
+        )
+
+        for window in allowed_windows:
+            try:
+                start = datetime.strptime(window["start"], "%H:%M").time()
+                end = datetime.strptime(window["end"], "%H:%M").time()
+            except (KeyError, ValueError) as e:
+                logger.error(f"Invalid change window {window}: {e}")
+                continue
+
+            day = window.get("day", "").lower()
+            windows.setdefault(day, []).append((start, end))
+
+        return windows
+
     async def evaluate(
         self,
         execution_plan: ExecutionPlan,
@@ -122,9 +154,8 @@ class PolicyEngine:
         # No plain text secrets
         if security_policies.get("secrets_encryption", {}).get("enabled"):
             # Check for suspicious plain text patterns
-            for key in plan.variables.keys():
-                if any(word in key.lower() for word in ['password', 'secret', 'key', 'token']):
-                    value = plan.variables.get(key, "")
+            for key, value in plan.variables.items():
+                if SECRET_NAME_PATTERN.search(key):
                     if isinstance(value, str) and not value.startswith("vault:"):
                         results.append(PolicyResult(
                             decision=PolicyDecision.DENY,
@@ -202,9 +233,7 @@ class PolicyEngine:
         # Change windows
         if operational_policies.get("change_windows", {}).get("enabled"):
             if plan.environment == "production":
-                allowed_windows = operational_policies["change_windows"].get("allowed_windows", [])
-
-                if not self._is_in_change_window(allowed_windows):
+                if not self._is_in_change_window():
                     results.append(PolicyResult(
                         decision=PolicyDecision.DENY,
                         policy_name="change_windows",
@@ -225,20 +254,16 @@ class PolicyEngine:
 
         return results
 
-    def _is_in_change_window(self, allowed_windows: List[Dict]) -> bool:
+    def _is_in_change_window(self) -> bool:
         """Check if current time is in allowed change window"""
 
         now = datetime.now()
         current_day = now.strftime("%A").lower()
         current_time = now.time()
 
-        for window in allowed_windows:
-            if window.get("day", "").lower() == current_day:
-                start = datetime.strptime(window["start"], "%H:%M").time()
-                end = datetime.strptime(window["end"], "%H:%M").time()
-
-                if start <= current_time <= end:
-                    return True
+        for start, end in self.change_windows.get(current_day, []):
+            if start <= current_time <= end:
+                return True
 
         return False
 
@@ -269,3 +294,4 @@ class PolicyEngine:
     def reload_policies(self):
         """Reload policies from file (for hot reload)"""
         self.policies = self._load_policies()
+        self.change_windows = self._parse_change_windows()
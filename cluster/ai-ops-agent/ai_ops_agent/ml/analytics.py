@@ -4,6 +4,8 @@ ML Analytics: Analyze logs for insights and fine-tuning
 
 from typing import List, Dict
 from datetime import datetime, timedelta
+import asyncio
+import heapq
 import json
 import logging
 
@@ -29,6 +31,11 @@ class MLAnalytics:
         Returns:
             Accuracy metrics dict
         """
+        # Log scans are blocking file reads; run them off the event loop
+        return await asyncio.to_thread(self._get_intent_accuracy, days)
+
+    def _get_intent_accuracy(self, days: int) -> Dict:
+        """Blocking implementation of get_intent_accuracy"""
 
         cutoff = datetime.now() - timedelta(days=days)
         correct = 0
@@ -76,6 +83,10 @@ class MLAnalytics:
         Returns:
             List of error pattern dicts
         """
+        return await asyncio.to_thread(self._get_error_patterns, limit)
+
+    def _get_error_patterns(self, limit: int) -> List[Dict]:
+        """Blocking implementation of get_error_patterns"""
 
         error_counts = {}
 
@@ -109,15 +120,13 @@ class MLAnalytics:
         except FileNotFoundError:
             logger.warning(f"Outcomes log not found: {self.outcomes_log}")
 
-        # Sort by count and return top N
-        sorted_errors = sorted(
+        # Select top N by count without sorting every pattern
+        return heapq.nlargest(
+            limit,
             error_counts.values(),
-            key=lambda x: x["count"],
-            reverse=True
+            key=lambda x: x["count"]
         )
 
-        return sorted_errors[:limit]
-
     async def get_policy_violation_trends(self, days: int = 30) -> List[Dict]:
         """
         Analyze policy violation trends
@@ -128,6 +137,10 @@ class MLAnalytics:
         Returns:
             List of violation trend dicts
         """
+        return await asyncio.to_thread(self._get_policy_violation_trends, days)
+
+    def _get_policy_violation_trends(self, days: int) -> List[Dict]:
+        """Blocking implementation of get_policy_violation_trends"""
 
         cutoff = datetime.now() - timedelta(days=days)
         violations_by_policy = {}
@@ -184,6 +197,10 @@ class MLAnalytics:
         Returns:
             Satisfaction metrics dict
         """
+        return await asyncio.to_thread(self._get_user_satisfaction, days)
+
+    def _get_user_satisfaction(self, days: int) -> Dict:
+        """Blocking implementation of get_user_satisfaction"""
 
         cutoff = datetime.now() - timedelta(days=days)
         scores = []
@@ -69,6 +69,15 @@ class OnboardingFlow:
         self.domain_manager = domain_manager
         self.sessions: Dict[str, OnboardingState] = {}
 
+        # Step → handler dispatch table for process_response
+        self._step_handlers = {
+            OnboardingStep.WELCOME: self._handle_welcome,
+            OnboardingStep.COLLECT_FAMILY_NAME: self._handle_family_name,
+            OnboardingStep.SUGGEST_ALTERNATIVES: self._handle_alternative_selection,
+            OnboardingStep.CONFIRM_DOMAIN: self._handle_domain_confirmation,
+            OnboardingStep.COLLECT_CONTACT_INFO: self._handle_contact_info,
+        }
+
     async def start_onboarding(self, session_id: str) -> str:
         """
         Start new onboarding session
@@ -105,27 +114,13 @@ class OnboardingFlow:
         state = self.sessions[session_id]
 
         # Route to appropriate handler based on current step
-        if state.current_step == OnboardingStep.WELCOME:
-            return await self._handle_welcome(state, user_input)
-
-        elif state.current_step == OnboardingStep.COLLECT_FAMILY_NAME:
-            return await self._handle_family_name(state, user_input)
-
-        elif state.current_step == OnboardingStep.CHECK_DOMAIN:
-            return await self._handle_domain_check(state, user_input)
-
-        elif state.current_step == OnboardingStep.SUGGEST_ALTERNATIVES:
-            return await self._handle_alternative_selection(state, user_input)
+        handler = self._step_handlers.get(state.current_step)
 
-        elif state.current_step == OnboardingStep.CONFIRM_DOMAIN:
-            return await self._handle_domain_confirmation(state, user_input)
-
-        elif state.current_step == OnboardingStep.COLLECT_CONTACT_INFO:
-            return await self._handle_contact_info(state, user_input)
-
-        else:
+        if handler is None:
             return "Invalid step. Please contact support."
 
+        return await handler(state, user_input)
+
     # ========================================================================
     # Step Handlers
     # ========================================================================
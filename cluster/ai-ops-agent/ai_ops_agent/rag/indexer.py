@@ -7,11 +7,18 @@ from typing import List, Dict, Optional
 import logging
 import hashlib
 import httpx
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient
 from qdrant_client.models import PointStruct, VectorParams, Distance, models
 
 logger = logging.getLogger(__name__)
 
+# File extensions treated as indexable text
+TEXT_EXTENSIONS = frozenset({
+    '.md', '.txt', '.yaml', '.yml', '.json', '.tf', '.py',
+    '.sh', '.bash', '.conf', '.cfg', '.ini', '.toml',
+    '.hcl', '.nomad', '.j2', '.tmpl'
+})
+
 
 class DocumentIndexer:
     """Index documents into Qdrant vector database"""
@@ -19,9 +26,10 @@ class DocumentIndexer:
     def __init__(self, ollama_host: str, qdrant_host: str):
         self.ollama_host = ollama_host.rstrip('/')
         self.qdrant_host = qdrant_host
-        self.qdrant = QdrantClient(url=qdrant_host)
+        self.qdrant = AsyncQdrantClient(url=qdrant_host)
         self.ollama_client = httpx.AsyncClient(timeout=60.0)
         self.embedding_model = "nomic-embed-text"
+        self.embeddings_url = f"{self.ollama_host}/api/embeddings"
         self.collection_name = "suhlabs-knowledge"
         self.embedding_dimension = 768  # nomic-embed-text dimension
 
@@ -81,17 +89,21 @@ class DocumentIndexer:
         indexed_count = 0
 
         for file_path in directory.glob(pattern):
-            if not file_path.is_file():
+            # Name-based filters first; they don't touch the filesystem.
+            # Suffix-less entries (mostly directories) are skipped quietly.
+            if not file_path.suffix:
+                continue
+
+            if not self._is_text_file(file_path):
+                logger.debug("Skipping non-text path: %s", file_path)
                 continue
 
             # Check exclusions
             if any(file_path.match(pat) for pat in exclude_patterns):
-                logger.debug(f"Skipping excluded file: {file_path}")
+                logger.debug("Skipping excluded file: %s", file_path)
                 continue
 
-            # Only index text files
-            if not self._is_text_file(file_path):
-                logger.debug(f"Skipping non-text file: {file_path}")
+            if not file_path.is_file():
                 continue
 
             try:
@@ -105,7 +117,7 @@ class DocumentIndexer:
     async def index_file(self, file_path: Path, doc_type: str):
         """Index a single file"""
 
-        logger.debug(f"Indexing file: {file_path}")
+        logger.debug("Indexing file: %s", file_path)
 
         # Read content
         try:
@@ -150,21 +162,19 @@ class DocumentIndexer:
                     collection_name=self.collection_name,
                     points=points
                 )
-                logger.debug(f"Uploaded {len(points)} points for {file_path}")
+                logger.debug("Uploaded %d points for %s", len(points), file_path)
             except Exception as e:
                 logger.error(f"Failed to upload points for {file_path}: {e}")
 
     async def _embed(self, text: str) -> List[float]:
         """Generate embedding vector for text"""
 
-        url = f"{self.ollama_host}/api/embeddings"
-
         payload = {
             "model": self.embedding_model,
             "prompt": text
         }
 
-        response = await self.ollama_client.post(url, json=payload)
+        response = await self.ollama_client.post(self.embeddings_url, json=payload)
         response.raise_for_status()
 
         data = response.json()
@@ -197,9 +207,7 @@ class DocumentIndexer:
                 continue
 
             # Split by '. ' for sentences
-            parts = line.split('. ')
-            for part in parts:
-                current.append(part)
+            current.extend(line.split('. '))
 
         if current:
             sentences.append(' '.join(current))
@@ -249,14 +257,7 @@ class DocumentIndexer:
 
     def _is_text_file(self, file_path: Path) -> bool:
         """Check if file is a text file"""
-
-        text_extensions = {
-            '.md', '.txt', '.yaml', '.yml', '.json', '.tf', '.py',
-            '.sh', '.bash', '.conf', '.cfg', '.ini', '.toml',
-            '.hcl', '.nomad', '.j2', '.tmpl'
-        }
-
-        return file_path.suffix.lower() in text_extensions
+        return file_path.suffix.lower() in TEXT_EXTENSIONS
 
     def _generate_id(self, file_path: str, chunk_index: int) -> str:
         """Generate unique ID for point"""
@@ -266,5 +267,6 @@ class DocumentIndexer:
         return hashlib.md5(raw.encode()).hexdigest()
 
     async def close(self):
-        """Close HTTP client"""
+        """Close HTTP clients"""
+        await self.qdrant.close()
         await self.ollama_client.aclose()
@@ -2,10 +2,11 @@
 RAG Retriever: Retrieve relevant context for queries
 """
 
+from collections import OrderedDict
 from typing import List, Optional
 import logging
 import httpx
-from qdrant_client import QdrantClient
+from qdrant_client import AsyncQdrantClient
 from qdrant_client.models import Filter, FieldCondition, MatchValue
 from ..models import RAGContext
 
@@ -15,14 +16,27 @@ logger = logging.getLogger(__name__)
 class RAGRetriever:
     """Retrieve relevant context for queries"""
 
-    def __init__(self, ollama_host: str, qdrant_host: str):
+    def __init__(
+        self,
+        ollama_host: str,
+        qdrant_host: str,
+        ollama_client: Optional[httpx.AsyncClient] = None
+    ):
         self.ollama_host = ollama_host.rstrip('/')
         self.qdrant_host = qdrant_host
-        self.qdrant = QdrantClient(url=qdrant_host)
-        self.ollama_client = httpx.AsyncClient(timeout=60.0)
+        self.qdrant = AsyncQdrantClient(url=qdrant_host)
+
+        # Reuse a caller-provided client (shared connection pool) if given
+        self._owns_client = ollama_client is None
+        self.ollama_client = ollama_client or httpx.AsyncClient(timeout=60.0)
         self.embedding_model = "nomic-embed-text"
+        self.embeddings_url = f"{self.ollama_host}/api/embeddings"
         self.collection_name = "suhlabs-knowledge"
 
+        # LRU cache of query embeddings (deterministic per model + text)
+        self.embedding_cache_size = 256
+        self._embedding_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+
     async def retrieve(
         self,
         query: str,
@@ -123,21 +137,34 @@ class RAGRetriever:
         return "\n".join(context_parts)
 
     async def _embed(self, text: str) -> List[float]:
-        """Generate embedding vector for text"""
+        """Generate embedding vector for text (LRU-cached)"""
 
-        url = f"{self.ollama_host}/api/embeddings"
+        cached = self._embedding_cache.get(text)
+        if cached is not None:
+            self._embedding_cache.move_to_end(text)
+            return cached
 
         payload = {
             "model": self.embedding_model,
             "prompt": text
         }
 
-        response = await self.ollama_client.post(url, json=payload)
+        response = await self.ollama_client.post(self.embeddings_url, json=payload)
         response.raise_for_status()
 
         data = response.json()
-        return data.get("embedding", [])
+        embedding = data.get("embedding", [])
+
+        # Don't cache empty results so a transient Ollama issue can recover
+        if embedding:
+            self._embedding_cache[text] = embedding
+            if len(self._embedding_cache) > self.embedding_cache_size:
+                self._embedding_cache.popitem(last=False)
+
+        return embedding
 
     async def close(self):
-        """Close HTTP client"""
-        await self.ollama_client.aclose()
+        """Close HTTP clients (Ollama client only if owned by this retriever)"""
+        await self.qdrant.close()
+        if self._owns_client:
+            await self.ollama_client.aclose()
@@ -12,9 +12,13 @@ from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict
 from pathlib import Path
+from contextlib import asynccontextmanager
 from datetime import datetime
+import asyncio
+import json
 import logging
 import os
+import httpx
 
 from ai_ops_agent.intent.parser import IntentParser
 from ai_ops_agent.intent.mapper import ActionMapper
@@ -36,11 +40,33 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Close HTTP clients on shutdown so pooled connections are released cleanly"""
+    yield
+
+    # Close everything even if one close() fails
+    results = await asyncio.gather(
+        intent_parser.close(),
+        rag_retriever.close(),
+        domain_manager.close(),
+        ollama_client.aclose(),
+        return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error(f"Error closing client on shutdown: {result}")
+
+    logger.info("AI Ops/Sec Agent shut down")
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="AI Ops/Sec Agent",
     version="2.0.0",
-    description="Natural language infrastructure automation with RAG and MCP"
+    description="Natural language infrastructure automation with RAG and MCP",
+    lifespan=lifespan
 )
 
 # Configuration
@@ -49,9 +75,16 @@ QDRANT_HOST = os.getenv("QDRANT_HOST", "http://localhost:6333")
 ML_LOG_DIR = os.getenv("ML_LOG_DIR", "/var/log/ai-ops")
 
 # Initialize components
-intent_parser = IntentParser(ollama_host=OLLAMA_HOST)
+# One HTTP client for all Ollama traffic so intent parsing and RAG
+# embeddings share a single keep-alive connection pool
+ollama_client = httpx.AsyncClient(timeout=60.0)
+intent_parser = IntentParser(ollama_host=OLLAMA_HOST, client=ollama_client)
 action_mapper = ActionMapper(mappings_path=Path("config/intent-mappings.yaml"))
-rag_retriever = RAGRetriever(ollama_host=OLLAMA_HOST, qdrant_host=QDRANT_HOST)
+rag_retriever = RAGRetriever(
+    ollama_host=OLLAMA_HOST,
+    qdrant_host=QDRANT_HOST,
+    ollama_client=ollama_client
+)
 policy_engine = PolicyEngine(policies_path=Path("config/mcp-policies.yaml"))
 approval_workflow = ApprovalWorkflow()
 ml_logger = MLLogger(log_dir=ML_LOG_DIR)
@@ -371,7 +404,8 @@ To check status: `/approval status {approval_id}`
             if execution_plan.terraform_module:
                 response_text += f"\n🏗️  Terraform Module: `{execution_plan.terraform_module}`"
 
-            response_text += f"\n\n**Variables:**\n```json\n{execution_plan.variables}\n```"
+            variables_json = json.dumps(execution_plan.variables, indent=2, default=str)
+            response_text += f"\n\n**Variables:**\n```json\n{variables_json}\n```"
 
             response_text += f"\n\n⚠️ **Note:** For MVP, execution is manual. Use the playbook/module above."
 